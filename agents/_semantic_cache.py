@@ -0,0 +1,203 @@
+"""Semantic similarity cache for prompt/response reuse.
+
+Provides an embedding-indexed LRU cache that returns a previously
+generated response when a new prompt is semantically close to one seen
+before, eliding the expensive generation call entirely. Falls back to
+exact-match caching when the embedding dependencies are unavailable.
+"""
+
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is a core dependency
+    np = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# Lightweight default model (384-dimensional embeddings)
+_DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """Embedding-similarity LRU cache for prompt/response pairs.
+
+    Attributes:
+        similarity_threshold: Minimum cosine similarity for a cache hit
+        max_entries: Maximum number of cached entries before LRU eviction
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.81,
+        max_entries: int = 256,
+        model_name: str = _DEFAULT_MODEL,
+    ):
+        """Initialize the semantic cache.
+
+        Args:
+            similarity_threshold: Cosine similarity above which a prior
+                response is reused
+            max_entries: Cache capacity; least recently used entries are
+                evicted beyond this
+            model_name: Sentence-transformers model used for embeddings
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._model_name = model_name
+        self._model = None
+        # key -> (embedding or None, response), ordered by recency
+        self._entries: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+
+    def _get_model(self):
+        """Lazily load the embedding model.
+
+        Returns:
+            SentenceTransformer instance or None if unavailable
+        """
+        if SentenceTransformer is None or np is None:
+            return None
+        if self._model is None:
+            self._model = SentenceTransformer(self._model_name)
+        return self._model
+
+    def _embed(self, texts: List[str]) -> Optional[Any]:
+        """Embed a batch of texts as unit-normalized float32 vectors.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Array of shape (len(texts), D) or None if embeddings are
+            unavailable
+        """
+        model = self._get_model()
+        if model is None:
+            return None
+        embeddings = np.asarray(
+            model.encode(texts, batch_size=32), dtype=np.float32
+        )
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def _lookup(self, key: str, query_embedding: Optional[Any]) -> Optional[Any]:
+        """Find a cached response for a single key/embedding.
+
+        Args:
+            key: Canonicalized prompt key
+            query_embedding: Unit-normalized query vector or None
+
+        Returns:
+            Cached response or None on miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][1]
+
+        if query_embedding is None or not self._entries:
+            return None
+
+        # Cosine similarity against all cached embeddings in one
+        # matrix-vector product; entries without embeddings are skipped.
+        keys = [k for k, (e, _) in self._entries.items() if e is not None]
+        if not keys:
+            return None
+        matrix = np.stack([self._entries[k][0] for k in keys])
+        scores = matrix @ query_embedding
+        best = int(np.argmax(scores))
+        if scores[best] > self.similarity_threshold:
+            best_key = keys[best]
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][1]
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached response for a prompt key.
+
+        Args:
+            key: Canonicalized prompt key
+
+        Returns:
+            Cached response or None on miss
+        """
+        return self.get_with_embedding(key)[0]
+
+    def get_with_embedding(self, key: str) -> Tuple[Optional[Any], Optional[Any]]:
+        """Look up a key, returning its embedding for reuse on a miss.
+
+        A caller that misses can pass the embedding straight back to put,
+        avoiding a second model call for the same key.
+
+        Args:
+            key: Canonicalized prompt key
+
+        Returns:
+            Tuple of (cached response or None, query embedding or None)
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            embedding, response = self._entries[key]
+            return response, embedding
+        embeddings = self._embed([key])
+        query = embeddings[0] if embeddings is not None else None
+        return self._lookup(key, query), query
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Look up cached responses for several keys with one batch embed.
+
+        Args:
+            keys: Canonicalized prompt keys
+
+        Returns:
+            List of cached responses (None for each miss), aligned with keys
+        """
+        return self.get_many_with_embeddings(keys)[0]
+
+    def get_many_with_embeddings(
+        self, keys: List[str]
+    ) -> Tuple[List[Optional[Any]], Optional[Any]]:
+        """Batch lookup that also returns the embeddings it computed.
+
+        Args:
+            keys: Canonicalized prompt keys
+
+        Returns:
+            Tuple of (cached responses aligned with keys, embedding matrix
+            of shape (len(keys), D) or None if embeddings are unavailable)
+        """
+        embeddings = self._embed(keys)
+        results = []
+        for i, key in enumerate(keys):
+            query = embeddings[i] if embeddings is not None else None
+            results.append(self._lookup(key, query))
+        return results, embeddings
+
+    def put(self, key: str, response: Any, embedding: Optional[Any] = None) -> None:
+        """Insert a prompt/response pair, evicting the LRU entry if full.
+
+        Args:
+            key: Canonicalized prompt key
+            response: Response to cache
+            embedding: Precomputed unit-normalized embedding for key; when
+                None it is computed here
+        """
+        if embedding is None:
+            embeddings = self._embed([key])
+            embedding = embeddings[0] if embeddings is not None else None
+        self._entries[key] = (embedding, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached entries."""
+        return len(self._entries)
@@ -5,13 +5,33 @@ It provides the core interface for agent execution, state management,
 and LLM integration.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
-from datetime import datetime
+import time
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Optional, List
+from datetime import datetime, timezone
 import json
 
+try:
+    import orjson
 
-class BaseAgent(ABC):
+    def _dumps(obj: Any) -> str:
+        """Serialize with orjson; handles datetime and NumPy natively."""
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        """Stdlib fallback when orjson is not installed."""
+        return json.dumps(obj, default=str)
+
+
+class BaseAgent(metaclass=ABCMeta):
     """Abstract base class for all autonomous agents.
     
     Attributes:
@@ -20,7 +40,9 @@ class BaseAgent(ABC):
         config: Configuration dictionary for the agent
         memory: Message history and state tracking
     """
-    
+
+    __slots__ = ("name", "description", "config", "memory", "created_at")
+
     def __init__(
         self,
         name: str,
@@ -37,7 +59,11 @@ class BaseAgent(ABC):
         self.name = name
         self.description = description
         self.config = config or {}
-        self.memory: List[Dict[str, Any]] = []
+        # Bounded so long-running agents keep a flat memory footprint;
+        # the oldest entries are evicted once the limit is reached
+        self.memory: Deque[Dict[str, Any]] = deque(
+            maxlen=self.config.get("memory_limit", 10000)
+        )
         self.created_at = datetime.now().isoformat()
     
     @abstractmethod
@@ -67,40 +93,79 @@ class BaseAgent(ABC):
     def add_to_memory(
         self,
         role: str,
-        content: str,
+        content: Any,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Add message to agent memory.
-        
+
         Args:
             role: Role of the message sender (user/assistant)
-            content: Message content
+            content: Message content; dicts are stored by reference and
+                only serialized at the boundary via to_json
             metadata: Optional additional metadata
         """
+        # Store a raw nanosecond timestamp; ISO formatting is deferred to
+        # get_memory so the hot logging path avoids datetime allocation
+        # and string formatting
         memory_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.time_ns(),
             "role": role,
             "content": content,
             "metadata": metadata or {},
         }
         self.memory.append(memory_entry)
-    
-    def get_memory(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+
+    def get_memory(
+        self,
+        limit: Optional[int] = None,
+        format_time: bool = True,
+    ) -> List[Dict[str, Any]]:
         """Retrieve agent memory.
-        
+
         Args:
             limit: Maximum number of recent messages to return
-            
+            format_time: Whether to add ISO-formatted timestamps to entries
+
         Returns:
             List of memory entries
         """
         if limit:
-            return self.memory[-limit:]
-        return self.memory
+            entries = islice(self.memory, max(0, len(self.memory) - limit), None)
+        else:
+            entries = self.memory
+        if format_time:
+            return [
+                {**entry, "timestamp": self._format_ts(entry["ts_ns"])}
+                for entry in entries
+            ]
+        return list(entries)
+
+    def to_json(self, limit: Optional[int] = None) -> str:
+        """Serialize agent memory to JSON lazily, at the boundary.
+
+        Args:
+            limit: Maximum number of recent entries to serialize
+
+        Returns:
+            JSON string of memory entries
+        """
+        return _dumps(self.get_memory(limit))
+
+    @staticmethod
+    def _format_ts(ts_ns: int) -> str:
+        """Convert a nanosecond timestamp to an ISO format string.
+
+        Args:
+            ts_ns: Timestamp in nanoseconds since the epoch
+
+        Returns:
+            ISO format timestamp
+        """
+        return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
     
     def clear_memory(self) -> None:
         """Clear the agent memory."""
-        self.memory = []
+        self.memory.clear()
     
     def get_state(self) -> Dict[str, Any]:
         """Get the current agent state.
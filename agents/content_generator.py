@@ -4,10 +4,84 @@ This agent generates creative, brand-aligned content based on trends,
 audience insights, and voice guidelines.
 """
 
-from typing import Any, Dict, Optional, List
+import asyncio
+import functools
+import types
+from typing import Any, Callable, Dict, Mapping, Optional, List
 from datetime import datetime
-from .base_agent import BaseAgent
-import json
+from .base_agent import BaseAgent, _dumps
+from ._semantic_cache import SemanticCache
+from config import PlatformConfig, get_config
+
+# Shared across instances so near-duplicate topics ("AI trends today" vs
+# "today's AI trends") hit the cache regardless of which agent saw them first.
+_semantic_cache = SemanticCache()
+
+# Content templates by style, shared read-only across all instances
+_TEMPLATES: Mapping[str, str] = types.MappingProxyType(
+    {
+        "conversational": "Let's talk about this...",
+        "educational": "Did you know?",
+        "inspirational": "Here's something that caught our attention...",
+        "promotional": "Check out what we've been working on...",
+        "news": "Breaking: Latest updates",
+    }
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(template: str, brand_tone: str) -> Callable[[str, str], str]:
+    """Precompile a content template for a (template, brand tone) pair.
+
+    The static prefix and suffix are built once per pair and captured in
+    the returned closure, so rendering only substitutes topic and tone.
+
+    Args:
+        template: Style template text
+        brand_tone: Brand voice tone baked into the output
+
+    Returns:
+        Closure rendering (topic, tone) into final content
+    """
+    prefix = f"{template}\n\nTopic: "
+    suffix = (
+        f"\nBrand Voice: {brand_tone}\n\n"
+        "Generated content for social media engagement."
+    )
+
+    def render(topic: str, tone: str) -> str:
+        return f"{prefix}{topic}\nTone: {tone}{suffix}"
+
+    return render
+
+
+def _optimize_twitter(content: str, max_len: int) -> str:
+    """Limit content to the platform character limit."""
+    return content[:max_len]
+
+
+def _optimize_tiktok(content: str, max_len: int) -> str:
+    """Add an engaging hook for tiktok."""
+    return f"Hook: {content}"
+
+
+def _optimize_instagram(content: str, max_len: int) -> str:
+    """Add a visual description for instagram."""
+    return f"[Visual: infographic]\n{content}"
+
+
+def _optimize_default(content: str, max_len: int) -> str:
+    """Pass content through unchanged for unknown platforms."""
+    return content
+
+
+# Platform-specific content optimizers, resolved once per agent at
+# construction time since the platform never changes afterwards
+_OPTIMIZERS = {
+    "twitter": _optimize_twitter,
+    "tiktok": _optimize_tiktok,
+    "instagram": _optimize_instagram,
+}
 
 
 class ContentGeneratorAgent(BaseAgent):
@@ -19,18 +93,30 @@ class ContentGeneratorAgent(BaseAgent):
         content_templates: Templates for content generation
     """
     
+    __slots__ = (
+        "platform",
+        "brand_voice",
+        "content_templates",
+        "_optimize",
+        "_max_len",
+        "_hashtag_limit",
+    )
+
     def __init__(
         self,
         platform: str = "twitter",
         brand_voice: Optional[Dict[str, str]] = None,
         config: Optional[Dict[str, Any]] = None,
+        platform_config: Optional[PlatformConfig] = None,
     ):
         """Initialize the Content Generator Agent.
-        
+
         Args:
             platform: Target social media platform
             brand_voice: Dictionary with brand personality traits
             config: Optional configuration
+            platform_config: Platform limits; defaults to the global
+                config entry for the platform
         """
         super().__init__(
             name="ContentGenerator",
@@ -43,7 +129,19 @@ class ContentGeneratorAgent(BaseAgent):
             "style": "conversational",
             "values": "innovation, transparency, excellence",
         }
-        self.content_templates = self._initialize_templates()
+        self.content_templates = _TEMPLATES
+        self._optimize = _OPTIMIZERS.get(platform, _optimize_default)
+        # Specialize platform limits once so the hot path never consults
+        # the config again; platforms without a config entry get no
+        # limits at all rather than inheriting the twitter defaults
+        if platform_config is None:
+            platform_config = get_config().get_platform_config(platform)
+        if platform_config is not None:
+            self._max_len = platform_config.max_content_length
+            self._hashtag_limit = platform_config.hashtag_limit
+        else:
+            self._max_len = None
+            self._hashtag_limit = None
     
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate content based on input parameters.
@@ -57,11 +155,28 @@ class ContentGeneratorAgent(BaseAgent):
         topic = input_data.get("topic", "")
         tone = input_data.get("tone") or self.brand_voice.get("tone")
         style = input_data.get("style") or self.brand_voice.get("style")
-        hashtags = input_data.get("hashtags", [])
+        hashtags = input_data.get("hashtags", [])[: self._hashtag_limit]
         
         content = await self._generate_content(topic, tone, style)
         optimized = await self._optimize_for_platform(content)
-        with_hashtags = f"{optimized}\n\n{' '.join(hashtags)}" if hashtags else optimized
+
+        # Join content and hashtags in one pass so only the final string
+        # is allocated
+        if hashtags:
+            parts = [optimized, "\n\n"]
+            for i, hashtag in enumerate(hashtags):
+                if i:
+                    parts.append(" ")
+                parts.append(hashtag)
+            with_hashtags = "".join(parts)
+        else:
+            with_hashtags = optimized
+
+        # Appending hashtags could previously push the content past the
+        # platform limit; enforce it once on the final string (platforms
+        # without a configured limit are never truncated)
+        if self._max_len is not None and len(with_hashtags) > self._max_len:
+            with_hashtags = with_hashtags[: self._max_len]
         
         result = {
             "status": "success",
@@ -74,7 +189,7 @@ class ContentGeneratorAgent(BaseAgent):
             "timestamp": datetime.now().isoformat(),
         }
         
-        self.add_to_memory("assistant", json.dumps(result))
+        self.add_to_memory("assistant", result)
         return result
     
     async def process(self, message: str) -> str:
@@ -102,18 +217,57 @@ class ContentGeneratorAgent(BaseAgent):
         Returns:
             Generated content
         """
-        # Mock content generation (would use LLM in production)
-        template = self.content_templates.get(style, "")
-        
-        content = f"""{template}
+        # Check the semantic cache first so near-duplicate prompts skip
+        # generation entirely; on a miss the lookup embedding is reused
+        # for the insert so each key is embedded at most once
+        cache_key = self._cache_key(topic, tone, style)
+        cached, embedding = _semantic_cache.get_with_embedding(cache_key)
+        if cached is not None:
+            return cached
 
-Topic: {topic}
-Tone: {tone}
-Brand Voice: {self.brand_voice.get('tone')}
-
-Generated content for social media engagement."""
-        
+        content = await self._generate_uncached(topic, tone, style)
+        _semantic_cache.put(cache_key, content, embedding=embedding)
         return content
+
+    async def _generate_uncached(self, topic: str, tone: str, style: str) -> str:
+        """Generate content without consulting the semantic cache.
+
+        Args:
+            topic: Content topic
+            tone: Tone of voice
+            style: Writing style
+
+        Returns:
+            Generated content
+        """
+        # Mock content generation (would use LLM in production); the
+        # template prefix/suffix are precompiled per (template, tone) pair
+        render = _compile_template(
+            self.content_templates.get(style, ""),
+            self.brand_voice.get("tone"),
+        )
+        return render(topic, tone)
+
+    def _cache_key(self, topic: str, tone: str, style: str) -> str:
+        """Build the canonicalized semantic cache key for a prompt.
+
+        The brand tone is part of the key because it is baked into the
+        rendered content; the cache is shared across instances, so
+        omitting it would serve one agent's voice to another (or a stale
+        voice after adapt_voice).
+
+        Args:
+            topic: Content topic
+            tone: Tone of voice
+            style: Writing style
+
+        Returns:
+            Canonicalized prompt key
+        """
+        return (
+            f"{self.platform}|{self.brand_voice.get('tone')}"
+            f"|{tone}|{style}|{topic}"
+        )
     
     async def _optimize_for_platform(self, content: str) -> str:
         """Optimize content for the target platform.
@@ -124,32 +278,8 @@ Generated content for social media engagement."""
         Returns:
             Optimized content
         """
-        # Platform-specific optimizations
-        if self.platform == "twitter":
-            # Limit to 280 characters
-            content = content[:280]
-        elif self.platform == "tiktok":
-            # Add engaging hooks
-            content = f"Hook: {content}"
-        elif self.platform == "instagram":
-            # Add visual descriptions
-            content = f"[Visual: infographic]\n{content}"
-        
-        return content
-    
-    def _initialize_templates(self) -> Dict[str, str]:
-        """Initialize content templates.
-        
-        Returns:
-            Dictionary of content templates by style
-        """
-        return {
-            "conversational": "Let's talk about this...",
-            "educational": "Did you know?",
-            "inspirational": "Here's something that caught our attention...",
-            "promotional": "Check out what we've been working on...",
-            "news": "Breaking: Latest updates",
-        }
+        # Dispatch to the optimizer resolved at construction time
+        return self._optimize(content, self._max_len)
     
     async def generate_carousel(self, topics: List[str], style: str = "conversational") -> List[str]:
         """Generate multiple content pieces for a carousel.
@@ -161,12 +291,34 @@ Generated content for social media engagement."""
         Returns:
             List of content pieces
         """
-        carousel_content = []
-        for topic in topics:
-            content = await self._generate_content(topic, self.brand_voice.get("tone"), style)
-            carousel_content.append(content)
-        
-        return carousel_content
+        tone = self.brand_voice.get("tone")
+
+        # Batch-embed all topics in one model call so cache lookups do not
+        # pay a per-topic embedding round-trip; the same embeddings are
+        # reused when inserting the misses, so no per-topic embeds remain
+        keys = [self._cache_key(topic, tone, style) for topic in topics]
+        cached, embeddings = _semantic_cache.get_many_with_embeddings(keys)
+
+        # Generate all cache misses concurrently; the semaphore keeps
+        # in-flight requests within platform rate limits
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrency", 8))
+
+        async def _generate(i: int) -> str:
+            async with semaphore:
+                content = await self._generate_uncached(topics[i], tone, style)
+            _semantic_cache.put(
+                keys[i],
+                content,
+                embedding=embeddings[i] if embeddings is not None else None,
+            )
+            return content
+
+        generated = await asyncio.gather(
+            *(_generate(i) for i, hit in enumerate(cached) if hit is None)
+        )
+
+        generated_iter = iter(generated)
+        return [hit if hit is not None else next(generated_iter) for hit in cached]
     
     def adapt_voice(self, new_voice: Dict[str, str]) -> None:
         """Adapt brand voice based on feedback.
@@ -175,4 +327,7 @@ Generated content for social media engagement."""
             new_voice: Updated brand voice guidelines
         """
         self.brand_voice.update(new_voice)
-        self.add_to_memory("system", f"Brand voice adapted: {json.dumps(new_voice)}")
+        # Compiled templates bake in the brand tone, so drop them when
+        # the voice changes
+        _compile_template.cache_clear()
+        self.add_to_memory("system", f"Brand voice adapted: {_dumps(new_voice)}")
@@ -7,8 +7,40 @@ optimizations based on collected data.
 from typing import Any, Dict, Optional, List
 from datetime import datetime, timedelta
 from .base_agent import BaseAgent
-import json
-from collections import defaultdict
+from bisect import bisect_right
+
+import numpy as np
+
+from ._metrics_kernel import process_batch
+
+# Columns of the struct-of-arrays sample store, in order
+_SAMPLE_COLUMNS = ("likes", "comments", "shares", "impressions")
+
+# All aggregated metric columns, raw samples plus derived values; the
+# aggregate vector is indexed in this order
+_METRIC_COLS = _SAMPLE_COLUMNS + (
+    "total_interactions",
+    "engagement_rate",
+    "engagement_rate_percent",
+)
+
+# Engagement rate thresholds and the statuses they delimit; a rate is
+# classified by its insertion point in _THRESHOLDS
+_THRESHOLDS = (0.03, 0.05, 0.08)
+_STATUSES = ("needs_improvement", "average", "good", "excellent")
+
+
+def classify_engagement_rates(rates: np.ndarray) -> List[str]:
+    """Classify engagement rates into status labels in one vectorized pass.
+
+    Args:
+        rates: Array of engagement rates
+
+    Returns:
+        List of status labels aligned with rates
+    """
+    indices = np.searchsorted(_THRESHOLDS, rates, side="right")
+    return [_STATUSES[i] for i in indices]
 
 
 class EngagementTrackerAgent(BaseAgent):
@@ -20,6 +52,14 @@ class EngagementTrackerAgent(BaseAgent):
         performance_threshold: Minimum engagement threshold
     """
     
+    __slots__ = (
+        "platform",
+        "metrics_history",
+        "performance_threshold",
+        "_metrics_array",
+        "_agg",
+    )
+
     def __init__(
         self,
         platform: str = "twitter",
@@ -39,7 +79,12 @@ class EngagementTrackerAgent(BaseAgent):
         self.platform = platform
         self.metrics_history: List[Dict[str, Any]] = []
         self.performance_threshold = 0.6
-        self.aggregated_metrics: Dict[str, float] = defaultdict(float)
+        # Struct-of-arrays store of raw samples; one row per processed
+        # metrics payload, columns per _SAMPLE_COLUMNS
+        self._metrics_array = np.empty((0, len(_SAMPLE_COLUMNS)), dtype=np.int64)
+        # Running totals per _METRIC_COLS, updated with one vector add
+        # per sample
+        self._agg = np.zeros(len(_METRIC_COLS), dtype=np.float64)
     
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute engagement tracking and analysis.
@@ -54,9 +99,9 @@ class EngagementTrackerAgent(BaseAgent):
         time_period = input_data.get("time_period", "7d")
         
         # Collect and analyze metrics
-        processed_metrics = await self._process_metrics(metrics_data)
-        analysis = await self._analyze_performance(processed_metrics)
-        recommendations = await self._generate_recommendations(analysis)
+        processed_metrics = self._process_metrics(metrics_data)
+        analysis = self._analyze_performance(processed_metrics)
+        recommendations = self._generate_recommendations(analysis)
         
         result = {
             "status": "success",
@@ -68,7 +113,7 @@ class EngagementTrackerAgent(BaseAgent):
         }
         
         self.metrics_history.append(result)
-        self.add_to_memory("assistant", json.dumps(result))
+        self.add_to_memory("assistant", result)
         return result
     
     async def process(self, message: str) -> str:
@@ -96,7 +141,7 @@ class EngagementTrackerAgent(BaseAgent):
         
         return response
     
-    async def _process_metrics(self, metrics_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_metrics(self, metrics_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process raw metrics data.
         
         Args:
@@ -122,15 +167,86 @@ class EngagementTrackerAgent(BaseAgent):
             "engagement_rate": round(engagement_rate, 4),
             "engagement_rate_percent": round(engagement_rate * 100, 2),
         }
-        
-        # Update aggregated metrics
-        for key, value in processed.items():
-            if isinstance(value, (int, float)):
-                self.aggregated_metrics[key] += value
-        
+
+        # Append the raw sample as one SoA row
+        row = np.array([[likes, comments, shares, impressions]], dtype=np.int64)
+        self._metrics_array = np.concatenate((self._metrics_array, row))
+
+        # One vector add instead of seven dict mutations
+        self._agg += np.array(
+            [
+                likes,
+                comments,
+                shares,
+                impressions,
+                total_interactions,
+                engagement_rate,
+                engagement_rate * 100,
+            ],
+            dtype=np.float64,
+        )
+
         return processed
     
-    async def _analyze_performance(self, processed_metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def process_metrics_batch(
+        self,
+        likes: np.ndarray,
+        comments: np.ndarray,
+        shares: np.ndarray,
+        impressions: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Process a batch of raw metric samples in one kernel call.
+
+        Batch counterpart of _process_metrics for webhook bursts of
+        per-post stats; the arithmetic runs through the JIT-compiled
+        kernel when Numba is installed.
+
+        Args:
+            likes: Per-post like counts
+            comments: Per-post comment counts
+            shares: Per-post share counts
+            impressions: Per-post impression counts
+
+        Returns:
+            Dictionary of processed metric columns
+        """
+        likes = np.asarray(likes, dtype=np.int64)
+        comments = np.asarray(comments, dtype=np.int64)
+        shares = np.asarray(shares, dtype=np.int64)
+        impressions = np.asarray(impressions, dtype=np.int64)
+
+        totals, rates, rate_percents = process_batch(
+            likes, comments, shares, impressions
+        )
+
+        # Append all samples to the SoA store in one concatenation
+        rows = np.stack((likes, comments, shares, impressions), axis=1)
+        self._metrics_array = np.concatenate((self._metrics_array, rows))
+
+        self._agg += np.array(
+            [
+                likes.sum(),
+                comments.sum(),
+                shares.sum(),
+                impressions.sum(),
+                totals.sum(),
+                rates.sum(),
+                rate_percents.sum(),
+            ],
+            dtype=np.float64,
+        )
+
+        return {
+            "likes": likes,
+            "comments": comments,
+            "shares": shares,
+            "impressions": impressions,
+            "total_interactions": totals,
+            "engagement_rate": rates,
+            "engagement_rate_percent": rate_percents,
+        }
+
+    def _analyze_performance(self, processed_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze engagement performance.
         
         Args:
@@ -140,17 +256,10 @@ class EngagementTrackerAgent(BaseAgent):
             Performance analysis
         """
         engagement_rate = processed_metrics.get("engagement_rate", 0)
-        
-        # Determine performance status
-        if engagement_rate >= 0.08:
-            status = "excellent"
-        elif engagement_rate >= 0.05:
-            status = "good"
-        elif engagement_rate >= 0.03:
-            status = "average"
-        else:
-            status = "needs_improvement"
-        
+
+        # Branchless status lookup via insertion point in the thresholds
+        status = _STATUSES[bisect_right(_THRESHOLDS, engagement_rate)]
+
         # Calculate engagement breakdown
         total = processed_metrics.get("total_interactions", 1)
         likes = processed_metrics.get("likes", 0)
@@ -170,7 +279,7 @@ class EngagementTrackerAgent(BaseAgent):
         
         return analysis
     
-    async def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate optimization recommendations.
         
         Args:
@@ -203,6 +312,20 @@ class EngagementTrackerAgent(BaseAgent):
         
         return recommendations
     
+    @property
+    def aggregated_metrics(self) -> Dict[str, float]:
+        """Aggregate totals over all processed samples.
+
+        Dictionary view over the fixed running-total vector maintained
+        incrementally by the processing paths.
+
+        Returns:
+            Dictionary of aggregated metric totals
+        """
+        if self._metrics_array.shape[0] == 0:
+            return {}
+        return dict(zip(_METRIC_COLS, self._agg.tolist()))
+
     def get_historical_data(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Retrieve historical engagement data.
         
@@ -222,15 +345,20 @@ class EngagementTrackerAgent(BaseAgent):
         Returns:
             Trend analysis dictionary
         """
-        if not self.metrics_history:
+        if self._metrics_array.shape[0] == 0:
             return {"status": "no_data", "message": "No historical data available"}
-        
-        recent = self.metrics_history[-7:] if len(self.metrics_history) >= 7 else self.metrics_history
-        
+
+        # Vectorized means over the most recent samples
+        recent = self._metrics_array[-7:]
+        recent_means = recent.mean(axis=0)
+
         trend = {
-            "period_analyzed": len(recent),
-            "metrics_tracked": list(self.aggregated_metrics.keys()),
+            "period_analyzed": recent.shape[0],
+            "metrics_tracked": list(_METRIC_COLS),
+            "recent_averages": dict(
+                zip(_SAMPLE_COLUMNS, (float(v) for v in recent_means))
+            ),
             "status": "data_available",
         }
-        
+
         return trend
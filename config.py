@@ -3,12 +3,19 @@
 Manages LangGraph settings, API configurations, and agent parameters.
 """
 
+import functools
 import os
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
 
+# Shared immutable media-type defaults; tuples are allocated once at
+# import and shared by every config instance
+_TWITTER_MEDIA = ("text", "image")
+_TIKTOK_MEDIA = ("text", "video", "image")
+_IG_MEDIA = ("text", "image", "carousel")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LangGraphConfig:
     """LangGraph configuration settings."""
     
@@ -24,7 +31,7 @@ class LangGraphConfig:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     """Configuration for individual agents."""
     
@@ -43,7 +50,7 @@ class AgentConfig:
     max_tokens: int = 2048
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlatformConfig:
     """Configuration for social media platforms."""
     
@@ -56,7 +63,7 @@ class PlatformConfig:
     
     # Content settings
     max_content_length: int = 280  # twitter default
-    supported_media: list = field(default_factory=lambda: ["text", "image"])
+    supported_media: Tuple[str, ...] = _TWITTER_MEDIA
     hashtag_limit: int = 10
 
 
@@ -98,12 +105,12 @@ class Config:
             "tiktok": PlatformConfig(
                 name="tiktok",
                 max_content_length=2200,
-                supported_media=["text", "video", "image"],
+                supported_media=_TIKTOK_MEDIA,
             ),
             "instagram": PlatformConfig(
                 name="instagram",
                 max_content_length=2200,
-                supported_media=["text", "image", "carousel"],
+                supported_media=_IG_MEDIA,
             ),
         }
         
@@ -172,5 +179,21 @@ class Config:
         return True
 
 
-# Global config instance
-config = Config()
+@functools.cache
+def get_config() -> Config:
+    """Get the global config instance, built lazily on first use.
+
+    Deferring construction avoids reading every environment variable at
+    import time in tooling that never touches the configuration.
+
+    Returns:
+        The shared Config instance
+    """
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep `from config import config` working without eager init."""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,11 @@ coordinates all agents and manages their execution flow.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import logging
+import types
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime
 import json
 
@@ -14,6 +18,32 @@ from agents import (
     ContentGeneratorAgent,
     EngagementTrackerAgent,
 )
+from utils import content_digest, setup_logging
+
+try:
+    # libuv-backed event loop; much lower per-task overhead than the
+    # default selector loop for the many concurrent agent/API calls
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+
+def _first_topic(trend_result: Dict[str, Any]) -> str:
+    """Extract the top trend's topic without allocating sentinels.
+
+    Args:
+        trend_result: Result dictionary from the trend monitor
+
+    Returns:
+        Topic of the first trend, or an empty string
+    """
+    trends = trend_result.get("trends")
+    if trends:
+        first = trends[0]
+        return first.get("topic", "") if isinstance(first, dict) else ""
+    return ""
 
 
 class AgentOrchestrator:
@@ -22,37 +52,56 @@ class AgentOrchestrator:
     Orchestrates the workflow between trend monitoring, content generation,
     and engagement tracking agents using LangGraph principles.
     """
-    
+
+    # Static shape of a success result; copying this template is cheaper
+    # than rebuilding the dict literal key by key on every workflow
+    _RESULT_TEMPLATE = {
+        "workflow_id": None,
+        "status": "success",
+        "timestamp": None,
+        "trends": None,
+        "content": None,
+        "engagement_analysis": None,
+        "recommendations": None,
+    }
+
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the orchestrator and all agents.
-        
+        """Initialize the orchestrator; agents are created on first use.
+
         Args:
             config: Optional configuration dictionary
         """
         self.config = config or {}
         self.agents = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        # Bounded so continuous_monitoring cannot grow the history
+        # without limit; the oldest records are evicted past the cap
+        self.execution_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self.config.get("history_limit", 1000)
+        )
         self.state = {
             "trends": [],
             "generated_content": [],
             "engagement_metrics": {},
         }
-        
-        # Initialize agents
-        self._initialize_agents()
-    
-    def _initialize_agents(self) -> None:
-        """Initialize all agent instances."""
-        self.agents["trend_monitor"] = TrendMonitorAgent(
-            platform=self.config.get("platform", "twitter")
-        )
-        self.agents["content_generator"] = ContentGeneratorAgent(
-            platform=self.config.get("platform", "twitter"),
-            brand_voice=self.config.get("brand_voice"),
-        )
-        self.agents["engagement_tracker"] = EngagementTrackerAgent(
-            platform=self.config.get("platform", "twitter")
-        )
+        self.log = logging.getLogger("orchestrator")
+
+        # Agents are constructed lazily on first use; each factory runs
+        # at most once
+        platform = self.config.get("platform", "twitter")
+        self._agent_factories = {
+            "trend_monitor": lambda: TrendMonitorAgent(platform=platform),
+            "content_generator": lambda: ContentGeneratorAgent(
+                platform=platform,
+                brand_voice=self.config.get("brand_voice"),
+            ),
+            "engagement_tracker": lambda: EngagementTrackerAgent(
+                platform=platform
+            ),
+        }
+        # Cached for zero-allocation status polling: a live read-only
+        # view over self.state
+        self._state_view = types.MappingProxyType(self.state)
     
     async def execute_workflow(self, input_params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the complete social media agent workflow.
@@ -69,76 +118,182 @@ class AgentOrchestrator:
         Returns:
             Complete workflow execution result
         """
-        workflow_id = datetime.now().isoformat()
-        
+        # One clock read at the start; the workflow id is its ISO form.
+        # datetime.now is bound locally since it is hit on both the start
+        # and completion reads.
+        now = datetime.now
+        start = now()
+        workflow_id = start.isoformat()
+        error: Optional[Exception] = None
+
         try:
-            # Step 1: Monitor trends
-            print("[Step 1] Monitoring trends...")
-            trend_result = await self.agents["trend_monitor"].execute(
-                {"query": input_params.get("query", "")}
-            )
-            self.state["trends"] = trend_result.get("trends", [])
-            
-            # Step 2: Generate content based on trends
-            print("[Step 2] Generating content...")
-            topic = input_params.get("topic") or (
-                trend_result.get("trends", [{}])[0].get("topic", "")
+            # Content generation depends on trend monitoring, but
+            # engagement tracking is independent — run the two branches
+            # concurrently and join afterwards
+            trend_content, engagement_result = await asyncio.gather(
+                self._trend_then_content(input_params),
+                self._track_engagement(input_params),
+                return_exceptions=True,
             )
-            
-            content_result = await self.agents["content_generator"].execute(
-                {
-                    "topic": topic,
-                    "tone": input_params.get("tone"),
-                    "hashtags": input_params.get("hashtags", []),
-                }
-            )
-            self.state["generated_content"].append(content_result)
-            
-            # Step 3: Track engagement (simulate post and collect metrics)
-            print("[Step 3] Tracking engagement...")
-            engagement_result = await self.agents["engagement_tracker"].execute(
-                {"metrics_data": input_params.get("metrics", {})}
-            )
-            self.state["engagement_metrics"] = engagement_result.get("analysis", {})
-            
-            # Compile results
-            result = {
-                "workflow_id": workflow_id,
-                "status": "success",
-                "timestamp": datetime.now().isoformat(),
-                "trends": self.state["trends"],
-                "content": content_result.get("content"),
-                "engagement_analysis": self.state["engagement_metrics"],
-                "recommendations": engagement_result.get("recommendations", []),
-            }
-            
-            self.execution_history.append(result)
-            return result
-            
+            if isinstance(trend_content, BaseException):
+                raise trend_content
+            if isinstance(engagement_result, BaseException):
+                raise engagement_result
+            trend_result, content_result = trend_content
+
+            # Apply state updates only after both branches completed so
+            # the state never reflects a half-finished workflow
+            state = self.state
+            state["trends"] = trend_result.get("trends", [])
+            state["generated_content"].append(content_result)
+            state["engagement_metrics"] = engagement_result.get("analysis", {})
+
         except Exception as e:
+            error = e
+
+        # One clock read at completion, shared by both outcome paths
+        timestamp = now().isoformat()
+
+        if error is not None:
             return {
                 "workflow_id": workflow_id,
                 "status": "error",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "error": str(error),
+                "timestamp": timestamp,
             }
+
+        # Compile results
+        result = self._RESULT_TEMPLATE.copy()
+        result["workflow_id"] = workflow_id
+        result["timestamp"] = timestamp
+        result["trends"] = state["trends"]
+        result["content"] = content_result.get("content")
+        result["engagement_analysis"] = state["engagement_metrics"]
+        result["recommendations"] = engagement_result.get("recommendations", [])
+
+        self.execution_history.append(result)
+        return result
     
-    async def continuous_monitoring(self, interval_seconds: int = 3600) -> None:
+    async def execute_workflow_many(
+        self,
+        params_list: List[Dict[str, Any]],
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Execute several workflows concurrently with bounded fan-out.
+
+        Args:
+            params_list: One input_params dict per workflow
+            concurrency: Maximum number of workflows in flight at once
+
+        Returns:
+            List of workflow results aligned with params_list; failures
+            are returned as exceptions
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.execute_workflow(params)
+
+        return await asyncio.gather(
+            *(_one(params) for params in params_list),
+            return_exceptions=True,
+        )
+
+    async def _trend_then_content(
+        self, input_params: Dict[str, Any]
+    ) -> tuple:
+        """Run trend monitoring followed by dependent content generation.
+
+        Args:
+            input_params: Workflow input parameters
+
+        Returns:
+            Tuple of (trend_result, content_result)
+        """
+        # Hoist agent lookups to locals for the duration of the branch
+        trend_agent = self.get_agent("trend_monitor")
+        content_agent = self.get_agent("content_generator")
+
+        self.log.info("[Step 1] Monitoring trends...")
+        trend_result = await trend_agent.execute(
+            {"query": input_params.get("query", "")}
+        )
+
+        self.log.info("[Step 2] Generating content...")
+        topic = input_params.get("topic") or _first_topic(trend_result)
+        content_result = await content_agent.execute(
+            {
+                "topic": topic,
+                "tone": input_params.get("tone"),
+                "hashtags": input_params.get("hashtags", []),
+            }
+        )
+        return trend_result, content_result
+
+    async def _track_engagement(
+        self, input_params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Run engagement tracking, independent of the trend branch.
+
+        Args:
+            input_params: Workflow input parameters
+
+        Returns:
+            Engagement tracking result
+        """
+        self.log.info("[Step 3] Tracking engagement...")
+        return await self.get_agent("engagement_tracker").execute(
+            {"metrics_data": input_params.get("metrics", {})}
+        )
+
+    async def continuous_monitoring(
+        self,
+        interval_seconds: int = 3600,
+        stop_event: Optional[asyncio.Event] = None,
+    ) -> None:
         """Run continuous monitoring of trends and content generation.
-        
+
         Args:
             interval_seconds: Interval between monitoring cycles
+            stop_event: Optional event that ends the loop cleanly when set
         """
-        print(f"Starting continuous monitoring (interval: {interval_seconds}s)")
-        
-        while True:
+        self.log.info("Starting continuous monitoring (interval: %ss)", interval_seconds)
+
+        # Schedule each cycle against a monotonic deadline so the cadence
+        # stays fixed instead of drifting by the workflow duration.
+        # Pre-bind the names resolved on every iteration so the loop
+        # body uses fast locals instead of global/attribute lookups.
+        loop = asyncio.get_running_loop()
+        sleep = asyncio.sleep
+        log = self.log
+        next_tick = loop.time()
+        last_digest = None
+
+        while stop_event is None or not stop_event.is_set():
             try:
                 result = await self.execute_workflow({"query": "trending topics"})
-                print(f"[{result['timestamp']}] Monitoring cycle complete")
-            except Exception as e:
-                print(f"Error in monitoring cycle: {e}")
-            
-            await asyncio.sleep(interval_seconds)
+                # Skip downstream publishing when the trends have not
+                # changed since the previous cycle
+                digest = content_digest(result.get("trends", []))
+                if digest == last_digest:
+                    log.debug(
+                        "[%s] Trends unchanged; skipping publish",
+                        result["timestamp"],
+                    )
+                else:
+                    last_digest = digest
+                    log.info("[%s] Monitoring cycle complete", result["timestamp"])
+            except asyncio.CancelledError:
+                # Propagate task cancellation instead of swallowing it
+                raise
+            except Exception:
+                log.exception("Monitoring cycle failed")
+
+            next_tick += interval_seconds
+            await sleep(max(0.0, next_tick - loop.time()))
+
+        self.log.info("Continuous monitoring stopped")
     
     def get_agent(self, agent_name: str):
         """Get a specific agent by name.
@@ -149,14 +304,22 @@ class AgentOrchestrator:
         Returns:
             Agent instance or None
         """
-        return self.agents.get(agent_name)
-    
+        agent = self.agents.get(agent_name)
+        if agent is None:
+            factory = self._agent_factories.get(agent_name)
+            if factory is None:
+                return None
+            agent = self.agents.setdefault(agent_name, factory())
+        return agent
+
     def get_all_agents(self) -> Dict[str, Any]:
-        """Get all initialized agents.
-        
+        """Get all agents, constructing any not yet used.
+
         Returns:
             Dictionary of agents
         """
+        for agent_name in self._agent_factories:
+            self.get_agent(agent_name)
         return self.agents
     
     def get_execution_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -166,37 +329,46 @@ class AgentOrchestrator:
             limit: Maximum number of records to return
             
         Returns:
-            List of execution records
+            List of execution records; oldest records beyond the
+            history_limit config (default 1000) are evicted
         """
         if limit:
-            return self.execution_history[-limit:]
-        return self.execution_history
+            start = max(0, len(self.execution_history) - limit)
+            return list(islice(self.execution_history, start, None))
+        return list(self.execution_history)
     
     def get_current_state(self) -> Dict[str, Any]:
         """Get the current orchestrator state.
         
         Returns:
-            Current state dictionary
+            Current state dictionary; the state field is a read-only
+            view, not a copy
         """
         return {
-            "state": self.state,
-            "agents_initialized": list(self.agents.keys()),
+            "state": self._state_view,
+            "agents_initialized": tuple(self.agents),
             "execution_count": len(self.execution_history),
             "last_execution": self.execution_history[-1] if self.execution_history else None,
         }
     
     def reset_state(self) -> None:
         """Reset the orchestrator state."""
-        self.state = {
-            "trends": [],
-            "generated_content": [],
-            "engagement_metrics": {},
-        }
-        print("Orchestrator state reset")
+        # generated_content is owned by the orchestrator, so its backing
+        # storage can be reused. trends and engagement_metrics alias the
+        # last workflow result (also stored in execution_history) —
+        # clearing those in place would wipe the recorded result, so they
+        # are rebound instead.
+        self.state["generated_content"].clear()
+        self.state["trends"] = []
+        self.state["engagement_metrics"] = {}
+        self.log.info("Orchestrator state reset")
 
 
 if __name__ == "__main__":
-    # Example usage
+    # Example usage; configure logging so the step/progress messages
+    # emitted at INFO level are actually visible
+    setup_logging()
+
     async def main():
         orchestrator = AgentOrchestrator(
             config={
@@ -3,26 +3,46 @@
 Provides helpers for logging, data processing, and API integration.
 """
 
+import hashlib
 import json
 from typing import Any, Dict
 from datetime import datetime
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bound once so hot callers skip the module attribute lookup
+_now = datetime.now
+
+# Cached logger so repeated setup_logging calls are O(1) no-ops
+_logger = None
+
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
-    """Set up logging configuration.
-    
+    """Set up logging configuration once and return the cached logger.
+
+    Subsequent calls return the logger configured by the first call;
+    the log_level argument only applies on first configuration.
+
     Args:
         log_level: Logging level
-        
+
     Returns:
         Configured logger
     """
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
-    return logging.getLogger(__name__)
+    global _logger
+    if _logger is None:
+        logging.basicConfig(
+            level=log_level,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+        _logger = logging.getLogger(__name__)
+    return _logger
 
 
 def serialize_data(data: Any) -> str:
@@ -34,6 +54,14 @@ def serialize_data(data: Any) -> str:
     Returns:
         JSON string
     """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS coerces non-string dict keys like the stdlib
+        # fallback does, keeping both paths accepting the same inputs
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        ).decode()
     return json.dumps(data, default=str)
 
 
@@ -46,16 +74,32 @@ def deserialize_data(data_str: str) -> Dict[str, Any]:
     Returns:
         Deserialized data
     """
+    if orjson is not None:
+        return orjson.loads(data_str)
     return json.loads(data_str)
 
 
+def content_digest(data: Any) -> str:
+    """Compute a stable content digest for change detection.
+
+    Args:
+        data: Data to digest
+
+    Returns:
+        Hex digest of the serialized data
+    """
+    return hashlib.blake2b(
+        serialize_data(data).encode(), digest_size=16
+    ).hexdigest()
+
+
 def format_timestamp() -> str:
     """Get formatted current timestamp.
     
     Returns:
         ISO format timestamp
     """
-    return datetime.now().isoformat()
+    return _now().isoformat()
 
 
 def calculate_engagement_rate(interactions: int, impressions: int) -> float:
@@ -68,9 +112,32 @@ def calculate_engagement_rate(interactions: int, impressions: int) -> float:
     Returns:
         Engagement rate as decimal
     """
-    if impressions == 0:
-        return 0.0
-    return interactions / impressions
+    return interactions / impressions if impressions else 0.0
+
+
+def calculate_engagement_rates(
+    interactions: np.ndarray, impressions: np.ndarray
+) -> np.ndarray:
+    """Calculate engagement rates for whole arrays of posts at once.
+
+    Vectorized counterpart of calculate_engagement_rate for bulk metrics
+    processing; zero-impression rows yield 0.0 without branching.
+
+    Args:
+        interactions: Per-post interaction counts
+        impressions: Per-post impression counts
+
+    Returns:
+        Array of engagement rates aligned with the inputs
+    """
+    interactions = np.asarray(interactions, dtype=np.float64)
+    impressions = np.asarray(impressions, dtype=np.float64)
+    return np.divide(
+        interactions,
+        impressions,
+        out=np.zeros_like(interactions),
+        where=impressions != 0,
+    )
 
 
 def truncate_text(text: str, max_length: int) -> str:
@@ -83,6 +150,12 @@ def truncate_text(text: str, max_length: int) -> str:
     Returns:
         Truncated text
     """
+    # Common case: nothing to do, return the original string untouched
     if len(text) <= max_length:
         return text
-    return text[:max_length-3] + "..."
+    # Guard tiny limits, where reserving 3 chars for the ellipsis would
+    # slice negatively
+    if max_length <= 3:
+        return "." * max_length
+    # f-string fuses the slice and ellipsis into a single allocation
+    return f"{text[:max_length - 3]}..."